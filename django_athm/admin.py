@@ -17,30 +17,44 @@ class ATHM_TransactionAdmin(admin.ModelAdmin):
     search_fields = ("reference_number",)
 
     def refund(self, request, queryset):
+        # Only load the columns read or written by ATHM_Transaction.refund
+        transactions = queryset.only(
+            "id", "reference_number", "status", "total", "refunded_amount"
+        )
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         try:
-            for transaction in queryset:
+            for transaction in transactions:
                 models.ATHM_Transaction.refund(transaction)
-                logger.debug(
-                    "[django_athm:refund success]",
-                    extra={"transaction": transaction.id},
-                )
+
+                if debug_enabled:
+                    logger.debug(
+                        "[django_athm:refund success]",
+                        extra={"transaction": transaction.id},
+                    )
 
             self.message_user(
-                request, f"Successfully refunded {queryset.count()} transactions!"
+                request, f"Successfully refunded {len(transactions)} transactions!"
             )
         except Exception as err:
             self.message_user(request, f"An error ocurred: {err}")
 
     def sync(self, request, queryset):
+        transactions = queryset.only("id", "reference_number")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         try:
-            for transaction in queryset:
+            for transaction in transactions:
                 models.ATHM_Transaction.inspect(transaction)
-                logger.debug(
-                    "[django_athm:sync success]", extra={"transaction": transaction.id}
-                )
+
+                if debug_enabled:
+                    logger.debug(
+                        "[django_athm:sync success]",
+                        extra={"transaction": transaction.id},
+                    )
 
             self.message_user(
-                request, f"Successfully refunded {queryset.count()} transactions!"
+                request, f"Successfully refunded {len(transactions)} transactions!"
             )
         except Exception as err:
             self.message_user(request, f"An error ocurred: {err}")
@@ -3,12 +3,10 @@ from django.core.exceptions import ImproperlyConfigured
 from django.core.signals import setting_changed
 from django.utils.module_loading import import_string
 
-from django_athm.views import default_callback
-
 DEFAULTS = {
     "SANDBOX_PUBLIC_TOKEN": "sandboxtoken01875617264",
     "SANDBOX_MODE": True,
-    "CALLBACK_VIEW": default_callback,
+    "CALLBACK_VIEW": "django_athm.views.default_callback",
     "PUBLIC_TOKEN": None,
     "PRIVATE_TOKEN": None,
 }
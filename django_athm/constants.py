@@ -1,27 +1,33 @@
 from enum import Enum
+from types import MappingProxyType
 
 API_BASE_URL = "https://www.athmovil.com"
+API_CONNECT_RETRIES = 3
 
 REFUND_URL = "/api/v4/refundTransaction"
 SEARCH_URL = "/api/v4/searchTransaction"
 REPORT_URL = "/transactions/v4/transactionReport"
 
-ERROR_DICT = {
-    "3010": "publicToken is invalid",
-    "3020": "publicToken is revoked",
-    "3030": "publicToken is required",
-    "3040": "privateToken is invalid",
-    "3050": "privateToken is revoked",
-    "3060": "privateToken is required",
-    "3070": "tokens are from different accounts",
-    "4010": "referenceNumber is required",
-    "5010": "transaction does not exist",
-    "5020": "transaction is from another business",
-    "7010": "transaction already refunded",
-    "7020": "amount is invalid",
-    "7030": "amount is required",
-    "7040": "error completing refund",
-}
+ERROR_DICT = MappingProxyType(
+    {
+        "3010": "publicToken is invalid",
+        "3020": "publicToken is revoked",
+        "3030": "publicToken is required",
+        "3040": "privateToken is invalid",
+        "3050": "privateToken is revoked",
+        "3060": "privateToken is required",
+        "3070": "tokens are from different accounts",
+        "4010": "referenceNumber is required",
+        "5010": "transaction does not exist",
+        "5020": "transaction is from another business",
+        "7010": "transaction already refunded",
+        "7020": "amount is invalid",
+        "7030": "amount is required",
+        "7040": "error completing refund",
+    }
+)
+
+BULK_BATCH_SIZE = 500
 
 BUTTON_COLOR_DEFAULT = "btn"
 BUTTON_COLOR_LIGHT = "btn-light"
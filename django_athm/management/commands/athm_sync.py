@@ -1,39 +1,67 @@
-import phonenumbers
+from datetime import datetime
+
 from django.core.management.base import BaseCommand, CommandError
+from django.db.transaction import atomic
 from django.utils.dateparse import parse_datetime
 from django.utils.timezone import make_aware
 
 from django_athm.conf import settings as app_settings
-from django_athm.constants import TransactionType
+from django_athm.constants import BULK_BATCH_SIZE, TransactionType
 from django_athm.models import ATHM_Client, ATHM_Item, ATHM_Transaction
+from django_athm.utils import format_phone_number, get_items_hash
+
+# Internal status for each upstream transaction type
+_TRANSACTION_TYPE_STATUSES = {
+    TransactionType.refund.value: ATHM_Transaction.Status.REFUNDED,
+    TransactionType.ecommerce.value: ATHM_Transaction.Status.COMPLETED,
+}
 
 
 def get_status(transaction):
-    if transaction["transactionType"].upper() == TransactionType.refund.value:
+    transaction_type = transaction["transactionType"].upper()
+
+    # Partially or fully refunded ecommerce transactions
+    if (
+        transaction_type == TransactionType.ecommerce.value
+        and float(transaction["totalRefundAmount"]) > 0
+    ):
         return ATHM_Transaction.Status.REFUNDED
-    elif transaction["transactionType"].upper() == TransactionType.ecommerce.value:
-        if float(transaction["totalRefundAmount"]) > 0:
-            return ATHM_Transaction.Status.REFUNDED
-        else:
-            return ATHM_Transaction.Status.COMPLETED
 
-    return transaction["transactionType"]
+    return _TRANSACTION_TYPE_STATUSES.get(
+        transaction_type, transaction["transactionType"]
+    )
 
 
 def get_defaults(transaction):
     return dict(
         reference_number=transaction["referenceNumber"],
         status=get_status(transaction),
-        date=make_aware(parse_datetime(transaction["date"])),
+        # Report dates look like "2019-06-06 17:12:02.0"; drop the fraction
+        date=make_aware(datetime.fromisoformat(transaction["date"][:19])),
         total=float(transaction["total"]),
         tax=float(transaction["tax"]),
         refunded_amount=float(transaction.get("totalRefundAmount", 0)),
         subtotal=float(transaction["subtotal"]),
         metadata_1=transaction.get("metadata1", None),
         metadata_2=transaction.get("metadata2", None),
+        items_hash=get_items_hash(transaction["items"]),
     )
 
 
+# Fields set by get_defaults, other than the reference_number lookup key
+_UPDATE_FIELDS = (
+    "status",
+    "date",
+    "total",
+    "tax",
+    "refunded_amount",
+    "subtotal",
+    "metadata_1",
+    "metadata_2",
+    "items_hash",
+)
+
+
 class Command(BaseCommand):
     help = "Synchronize the database with results from the ATH Móvil API."
 
@@ -123,56 +151,83 @@ class Command(BaseCommand):
 
         self.stdout.write("Saving results to database...")
 
-        # For each transaction, create or update an ATHM_Transaction instance
-        for transaction_data in report_data:
-            (
-                transaction,
-                transaction_created,
-            ) = ATHM_Transaction.objects.update_or_create(
-                reference_number=transaction_data["referenceNumber"],
-                defaults=get_defaults(transaction_data),
-            )
-
-            phone_number_parsed = phonenumbers.parse(
-                transaction_data["phoneNumber"], "US"
-            )
-            phone_number_formatted = phonenumbers.format_number(
-                phone_number_parsed, phonenumbers.PhoneNumberFormat.E164
-            )
+        # Load every already stored transaction in the report with one query
+        existing_transactions = ATHM_Transaction.objects.in_bulk(
+            [transaction_data["referenceNumber"] for transaction_data in report_data],
+            field_name="reference_number",
+        )
 
-            # Get or create an ATHM_Client instance
-            _, client_created = ATHM_Client.objects.get_or_create(
-                email=transaction_data["email"].strip(),
-                phone_number=phone_number_formatted,
-                defaults=dict(name=transaction_data["name"].strip()),
-            )
+        new_transactions = []
+        updated_transactions = []
+        stale_item_transactions = []
+        item_instances = []
 
-            # Accumulate ATHM_Item instances in this list
-            item_instances = [
-                ATHM_Item(
-                    transaction=transaction,
-                    name=item["name"],
-                    description=item["description"],
-                    quantity=int(item["quantity"]),
-                    price=float(item["price"]),
-                    tax=float(item["price"]),
-                    metadata=item["metadata"],
-                )
-                for item in transaction_data["items"]
-            ]
+        # For each transaction, create or update an ATHM_Transaction instance
+        for transaction_data in report_data:
+            defaults = get_defaults(transaction_data)
 
-            # Bulk create all ATHM_Item instances, if any
-            if item_instances:
-                ATHM_Item.objects.bulk_create(item_instances)
+            transaction = existing_transactions.get(defaults["reference_number"])
+            if transaction is None:
+                transaction = ATHM_Transaction(**defaults)
+                new_transactions.append(transaction)
+                existing_transactions[transaction.reference_number] = transaction
 
-            # Update counts to display later
-            if transaction_created:
+                items_unchanged = False
                 total_transaction_created += 1
             else:
+                # Skip the items entirely if they were already synced unchanged,
+                # otherwise replace the stored ones with the report's
+                items_unchanged = transaction.items_hash == defaults["items_hash"]
+                if not items_unchanged:
+                    stale_item_transactions.append(transaction)
+
+                for field, value in defaults.items():
+                    setattr(transaction, field, value)
+                updated_transactions.append(transaction)
+
                 total_transactions_updated += 1
 
-            if client_created:
-                total_clients_created += 1
+            phone_number = format_phone_number(transaction_data.get("phoneNumber"))
+
+            # Get or create an ATHM_Client instance, skipping malformed numbers
+            if phone_number:
+                _, client_created = ATHM_Client.objects.get_or_create(
+                    email=transaction_data["email"].strip(),
+                    phone_number=phone_number,
+                    defaults=dict(name=transaction_data["name"].strip()),
+                )
+
+                if client_created:
+                    total_clients_created += 1
+
+            # Accumulate ATHM_Item instances for every transaction in this list
+            if not items_unchanged:
+                item_instances.extend(
+                    ATHM_Item(
+                        transaction=transaction,
+                        name=item["name"],
+                        description=item["description"],
+                        quantity=int(item["quantity"]),
+                        price=float(item["price"]),
+                        tax=float(item["price"]),
+                        metadata=item["metadata"],
+                    )
+                    for item in transaction_data["items"]
+                )
+
+        # Write the whole report in a handful of batched queries
+        with atomic():
+            ATHM_Transaction.objects.bulk_create(
+                new_transactions, batch_size=BULK_BATCH_SIZE
+            )
+            ATHM_Transaction.objects.bulk_update(
+                updated_transactions, _UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+            # Drop outdated items in batches to stay under query parameter limits
+            for start in range(0, len(stale_item_transactions), BULK_BATCH_SIZE):
+                batch = stale_item_transactions[start : start + BULK_BATCH_SIZE]
+                ATHM_Item.objects.filter(transaction__in=batch).delete()
+            ATHM_Item.objects.bulk_create(item_instances, batch_size=BULK_BATCH_SIZE)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.13 on 2026-10-16 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_athm", "0003_athm_client_alter_athm_item_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="athm_transaction",
+            name="items_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=16, null=True
+            ),
+        ),
+    ]
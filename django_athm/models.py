@@ -68,6 +68,9 @@ class ATHM_Transaction(models.Model):
     metadata_1 = models.CharField(max_length=64, blank=True, null=True)
     metadata_2 = models.CharField(max_length=64, blank=True, null=True)
 
+    # Fingerprint of the stored items, used to skip rewriting unchanged items
+    items_hash = models.CharField(max_length=16, blank=True, null=True, editable=False)
+
     client = models.ForeignKey(
         ATHM_Client,
         null=True,
@@ -1,5 +1,6 @@
 import logging
 
+import django
 from django import template
 
 from django_athm.constants import TransactionStatus
@@ -15,16 +16,38 @@ register = template.Library()
 logger = logging.getLogger(__name__)
 
 
+# Status specific signal for each checkout response status
+_STATUS_SIGNALS = {
+    TransactionStatus.expired.value: athm_expired_response,
+    TransactionStatus.cancelled.value: athm_cancelled_response,
+    TransactionStatus.completed.value: athm_completed_response,
+}
+
+
+def _send_robust(signal):
+    responses = signal.send_robust(sender="django_athm")
+
+    # Django 4.1+ already logs receiver errors caught by send_robust
+    if django.VERSION >= (4, 1):
+        return
+
+    for receiver, response in responses:
+        if isinstance(response, Exception):
+            logger.error(
+                "[django_athm:athm_response_signal receiver error]",
+                exc_info=response,
+                extra={"receiver": receiver},
+            )
+
+
 @register.simple_tag
 def athm_response_signal(status):
-    logger.debug("[django_athm:athm_response_signal]", extra={"status": status})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[django_athm:athm_response_signal]", extra={"status": status})
 
-    if status == TransactionStatus.expired.value:
-        athm_expired_response.send(sender="django_athm")
-    elif status == TransactionStatus.cancelled.value:
-        athm_cancelled_response.send(sender="django_athm")
-    elif status == TransactionStatus.completed.value:
-        athm_completed_response.send(sender="django_athm")
+    status_signal = _STATUS_SIGNALS.get(status)
+    if status_signal is not None:
+        _send_robust(status_signal)
 
     # Send a general signal
-    athm_response_received.send(sender="django_athm")
+    _send_robust(athm_response_received)
@@ -1,17 +1,48 @@
+import hashlib
+import json
 import logging
+import re
+import weakref
 from abc import ABC, abstractmethod
 
 import httpx
+import phonenumbers
 
-from .constants import API_BASE_URL, ERROR_DICT
+from .constants import API_BASE_URL, API_CONNECT_RETRIES, ERROR_DICT
 
 logger = logging.getLogger(__name__)
 
+# Digits with common separators, optionally followed by an extension
+_PHONE_NUMBER_RE = re.compile(
+    r"^\+?[\d\s\-\(\)\.]{7,20}(?:\s*(?:x|ext\.?|extension)\s*\d{1,6})?$",
+    re.IGNORECASE,
+)
+
 
 def parse_error_code(error_code):
     return ERROR_DICT.get(error_code, "unknown error")
 
 
+def get_items_hash(items):
+    serialized_items = json.dumps(items, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(serialized_items.encode(), digest_size=8).hexdigest()
+
+
+def format_phone_number(phone_number):
+    # Reject malformed values before they reach phonenumbers or the database
+    if not phone_number or not _PHONE_NUMBER_RE.match(phone_number):
+        return None
+
+    try:
+        parsed_number = phonenumbers.parse(phone_number, "US")
+    except phonenumbers.NumberParseException:
+        return None
+
+    return phonenumbers.format_number(
+        parsed_number, phonenumbers.PhoneNumberFormat.E164
+    )
+
+
 class BaseHTTPAdapter(ABC):
     client = None
 
@@ -25,21 +56,30 @@ class BaseHTTPAdapter(ABC):
 
 
 class SyncHTTPAdapter(BaseHTTPAdapter):
+    def _get_client(self):
+        if self.client is None:
+            # Retry transient connection failures at the transport level
+            transport = httpx.HTTPTransport(retries=API_CONNECT_RETRIES)
+            self.client = httpx.Client(base_url=API_BASE_URL, transport=transport)
+
+            # Release pooled connections once the adapter is garbage collected
+            weakref.finalize(self, self.client.close)
+
+        return self.client
+
     def get_with_data(self, url, data):
-        extra = {"url": url}
-        logger.debug("[django_athm:get_with_data]", extra=extra)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[django_athm:get_with_data]", extra={"url": url})
 
-        with httpx.Client(base_url=API_BASE_URL) as client:
-            response = client.request(method="GET", url=url, json=data)
-            return response.json()
+        response = self._get_client().request(method="GET", url=url, json=data)
+        return response.json()
 
     def post(self, url, data):
-        extra = {"url": url}
-        logger.debug("[django_athm:post]", extra=extra)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[django_athm:post]", extra={"url": url})
 
-        with httpx.Client(base_url=API_BASE_URL) as client:
-            response = client.post(url, json=data)
-            return response.json()
+        response = self._get_client().post(url, json=data)
+        return response.json()
 
 
 def get_http_adapter():
@@ -1,70 +1,116 @@
 import json
 import logging
 
+from django.db import transaction
 from django.http import HttpResponse
 from django.utils import timezone
 
 from django_athm import models
+from django_athm.constants import BULK_BATCH_SIZE
+from django_athm.utils import format_phone_number, get_items_hash
 
 logger = logging.getLogger(__name__)
 
 app_name = "django_athm"
 
+_STATUS_COMPLETED = models.ATHM_Transaction.Status.COMPLETED
 
-def default_callback(request):
-    reference_number = request.POST["referenceNumber"]
-    total = float(request.POST["total"])
-
-    subtotal = request.POST["subtotal"]
-    if subtotal:
-        subtotal = float(subtotal)
-    else:
-        subtotal = None
-
-    tax = request.POST["tax"]
-    if tax:
-        tax = float(tax)
-    else:
-        tax = None
-
-    metadata_1 = request.POST["metadata1"]
-    if not metadata_1:
-        metadata_1 = None
-
-    metadata_2 = request.POST["metadata2"]
-    if not metadata_2:
-        metadata_2 = None
-
-    transaction = models.ATHM_Transaction.objects.create(
-        reference_number=reference_number,
-        status=models.ATHM_Transaction.Status.COMPLETED,
-        total=total,
-        subtotal=subtotal,
-        tax=tax,
-        metadata_1=metadata_1,
-        metadata_2=metadata_2,
+# Pre-encoded bodies for bad payload responses; field names are our own keys
+_INVALID_VALUE_ERROR = b'{"error": "Invalid field value format"}'
+_MISSING_FIELD_ERROR = b'{"error": "Missing required field: %s"}'
+_MISSING_ITEM_FIELD_ERROR = b'{"error": "Missing required item field: %s"}'
+
+
+def _float_or_none(value):
+    return float(value) if value else None
+
+
+def _bad_request(content):
+    return HttpResponse(content, status=400, content_type="application/json")
+
+
+def _parse_callback_data(data):
+    items = json.loads(data["items"])
+
+    transaction_fields = dict(
+        reference_number=data["referenceNumber"],
+        status=_STATUS_COMPLETED,
+        total=float(data["total"]),
+        subtotal=_float_or_none(data["subtotal"]),
+        tax=_float_or_none(data["tax"]),
+        metadata_1=data["metadata1"] or None,
+        metadata_2=data["metadata2"] or None,
         date=timezone.now(),
+        items_hash=get_items_hash(items),
     )
 
-    item_instances = []
-    items = json.loads(request.POST["items"])
-
-    for item in items:
-        item_instances.append(
-            models.ATHM_Item(
-                transaction=transaction,
-                name=item["name"],
-                description=item["description"],
-                quantity=int(item["quantity"]),
-                price=float(item["price"]),
-                tax=float(item["tax"]) if item["tax"] else None,
-                metadata=item["metadata"] if item["metadata"] else None,
-            )
+    return transaction_fields, items
+
+
+def _parse_items(items):
+    return [
+        models.ATHM_Item(
+            name=item["name"],
+            description=item["description"],
+            quantity=int(item["quantity"]),
+            price=float(item["price"]),
+            tax=_float_or_none(item["tax"]),
+            metadata=item["metadata"] or None,
         )
+        for item in items
+    ]
+
+
+def _get_client(data):
+    phone_number = format_phone_number(data.get("phoneNumber"))
+    if not phone_number:
+        return None
 
-    if item_instances:
-        models.ATHM_Item.objects.bulk_create(item_instances)
+    name = data.get("name", "").strip()
+
+    # Same key as athm_sync, so a payload can never rewrite another client's row
+    client, created = models.ATHM_Client.objects.get_or_create(
+        email=data.get("email", "").strip(),
+        phone_number=phone_number,
+        defaults=dict(name=name),
+    )
 
-    # TODO: Create ATHM_Client instance
+    # Refresh only the name of the exact match, with a single narrow UPDATE
+    if not created and name and client.name != name:
+        models.ATHM_Client.objects.filter(pk=client.pk).update(name=name)
+        client.name = name
+
+    return client
+
+
+def default_callback(request):
+    # Snapshot the QueryDict once; plain dict lookups are cheaper from here on
+    data = request.POST.dict()
+
+    try:
+        transaction_fields, items = _parse_callback_data(data)
+    except KeyError as err:
+        return _bad_request(_MISSING_FIELD_ERROR % err.args[0].encode())
+    except (TypeError, ValueError):
+        return _bad_request(_INVALID_VALUE_ERROR)
+
+    # Parsed separately so a key missing inside an item is reported as such
+    try:
+        item_instances = _parse_items(items)
+    except KeyError as err:
+        return _bad_request(_MISSING_ITEM_FIELD_ERROR % err.args[0].encode())
+    except (TypeError, ValueError):
+        return _bad_request(_INVALID_VALUE_ERROR)
+
+    # Roll back the client write too if the transaction can't be stored
+    with transaction.atomic():
+        transaction_fields["client"] = _get_client(data)
+
+        transaction_obj = models.ATHM_Transaction.objects.create(**transaction_fields)
+
+        for item_instance in item_instances:
+            item_instance.transaction = transaction_obj
+
+        models.ATHM_Item.objects.bulk_create(item_instances, batch_size=BULK_BATCH_SIZE)
 
     return HttpResponse(status=201)
@@ -7,7 +7,10 @@ athm_config_fixture = (
     Path(__file__).resolve().parent.parent.parent / "fixtures" / "athm_config.json"
 )
 
+# The fixture is read-only, so parse it once at import
+with athm_config_fixture.open() as fp:
+    home_context = json.load(fp)
+
 
 def home_view(request):
-    with athm_config_fixture.open() as fp:
-        return render(request, "home.html", context=json.load(fp))
+    return render(request, "home.html", context=home_context)
@@ -1,11 +1,18 @@
 import pytest
 import respx
+from django.test import RequestFactory
 from httpx import Response
 
 from django_athm.constants import API_BASE_URL, REFUND_URL, REPORT_URL, SEARCH_URL
 from django_athm.utils import SyncHTTPAdapter
 
 
+@pytest.fixture(scope="session")
+def rf():
+    # Overrides pytest-django's function-scoped rf; the factory holds no state
+    return RequestFactory()
+
+
 @pytest.fixture()
 def mock_http_adapter_get_with_data(mocker):
     return mocker.patch.object(SyncHTTPAdapter, "get_with_data")
@@ -12,72 +12,93 @@ from django_athm.models import ATHM_Transaction
 
 pytestmark = pytest.mark.django_db
 
+TRANSACTION_DATE = make_aware(parse_datetime("2022-08-05 10:00:00.0"))
+
 
 def dummy_get_response(request):
     return None
 
 
-class TestAdminCommands:
-    def test_athm_transaction_refund_success(self, rf, mock_http_adapter_post):
-        mock_http_adapter_post.return_value.json.return_value = {
-            "refundStatus": "COMPLETED",
-            "refundedAmount": "25.50",
-        }
-        request = rf.post(reverse("admin:django_athm_athm_transaction_changelist"))
-
-        SessionMiddleware(dummy_get_response).process_request(request)
-        MessageMiddleware(dummy_get_response).process_request(request)
-        request.session.save()
-
-        ATHM_Transaction.objects.create(
-            reference_number="test-123",
-            status=ATHM_Transaction.Status.COMPLETED,
-            total=25.50,
-            subtotal=23.10,
-            tax=2.40,
-            metadata_1="Metadata!",
-            date=make_aware(parse_datetime("2022-08-05 10:00:00.0")),
-        )
+# Neither middleware keeps per-request state, so one instance serves every test
+_SESSION_MW = SessionMiddleware(dummy_get_response)
+_MESSAGE_MW = MessageMiddleware(dummy_get_response)
 
-        ATHM_TransactionAdmin(model=ATHM_Transaction, admin_site=admin.site).refund(
-            request=request,
-            queryset=ATHM_Transaction.objects.filter(reference_number="test-123"),
-        )
 
-        updated_transaction = ATHM_Transaction.objects.get(reference_number="test-123")
-        assert updated_transaction.status == ATHM_Transaction.Status.REFUNDED
-        assert updated_transaction.refunded_amount == 25.50
-
-        messages = get_messages(request)
-
-        assert str(list(messages)[0]) == "Successfully refunded 1 transactions!"
-
-    def test_athm_transaction_refund_failed(self, rf, mock_http_adapter_post):
-        mock_http_adapter_post.return_value.json.return_value = {
-            "errorCode": "5010",
-            "description": "Transaction does not exist",
-        }
-        request = rf.post(reverse("admin:django_athm_athm_transaction_changelist"))
-
-        SessionMiddleware(dummy_get_response).process_request(request)
-        MessageMiddleware(dummy_get_response).process_request(request)
-        request.session.save()
-
-        ATHM_Transaction.objects.create(
-            reference_number="error",
-            status=ATHM_Transaction.Status.COMPLETED,
-            total=25.50,
-            subtotal=23.10,
-            tax=2.40,
-            metadata_1="Metadata!",
-            date=make_aware(parse_datetime("2022-08-05 10:00:00.0")),
-        )
+@pytest.fixture(scope="module")
+def changelist_url():
+    return reverse("admin:django_athm_athm_transaction_changelist")
+
+
+@pytest.fixture
+def admin_request(rf, changelist_url):
+    request = rf.post(changelist_url)
+
+    _SESSION_MW.process_request(request)
+    _MESSAGE_MW.process_request(request)
+    request.session.save()
 
-        ATHM_TransactionAdmin(model=ATHM_Transaction, admin_site=admin.site).refund(
-            request=request,
-            queryset=ATHM_Transaction.objects.filter(reference_number="error"),
+    return request
+
+
+@pytest.fixture(scope="module")
+def transaction_admin():
+    return ATHM_TransactionAdmin(model=ATHM_Transaction, admin_site=admin.site)
+
+
+@pytest.fixture
+def athm_transaction():
+    return ATHM_Transaction.objects.create(
+        reference_number="test-123",
+        status=ATHM_Transaction.Status.COMPLETED,
+        total=25.50,
+        subtotal=23.10,
+        tax=2.40,
+        metadata_1="Metadata!",
+        date=TRANSACTION_DATE,
+    )
+
+
+class TestAdminCommands:
+    @pytest.mark.parametrize(
+        "response, expected_status, expected_refunded_amount, expected_message",
+        [
+            (
+                {"refundStatus": "COMPLETED", "refundedAmount": "25.50"},
+                ATHM_Transaction.Status.REFUNDED,
+                25.50,
+                "Successfully refunded 1 transactions!",
+            ),
+            (
+                {"errorCode": "5010", "description": "Transaction does not exist"},
+                ATHM_Transaction.Status.COMPLETED,
+                None,
+                "An error ocurred: Transaction does not exist",
+            ),
+        ],
+        ids=["success", "failed"],
+    )
+    def test_athm_transaction_refund(
+        self,
+        admin_request,
+        transaction_admin,
+        mock_http_adapter_post,
+        athm_transaction,
+        response,
+        expected_status,
+        expected_refunded_amount,
+        expected_message,
+    ):
+        mock_http_adapter_post.return_value.json.return_value = response
+
+        transaction_admin.refund(
+            request=admin_request,
+            queryset=ATHM_Transaction.objects.filter(pk=athm_transaction.pk),
         )
 
-        messages = get_messages(request)
+        athm_transaction.refresh_from_db()
+        assert athm_transaction.status == expected_status
+        assert athm_transaction.refunded_amount == expected_refunded_amount
+
+        messages = get_messages(admin_request)
 
-        assert str(list(messages)[0]) == "An error ocurred: Transaction does not exist"
+        assert str(list(messages)[0]) == expected_message
@@ -171,7 +171,7 @@ class TestSyncCommand:
             price=1.00,
             tax=1.00,
             metadata="metadata test",
-        ),
+        )
         ATHM_Item.objects.create(
             name="Second Item",
             transaction=existing_transaction,
@@ -180,9 +180,7 @@ class TestSyncCommand:
             price=1.00,
             tax=1.00,
             metadata="metadata test",
-        ),
-
-        existing_transaction.save()
+        )
 
         out = StringIO()
         call_command(
@@ -203,7 +201,7 @@ class TestSyncCommand:
         )
 
         assert ATHM_Transaction.objects.count() == 2
-        assert ATHM_Item.objects.count() == 6
+        assert ATHM_Item.objects.count() == 4
         assert ATHM_Client.objects.count() == 1
 
         transaction_1 = ATHM_Transaction.objects.get(
@@ -228,6 +226,8 @@ class TestSyncCommand:
         assert ATHM_Item.objects.filter(
             transaction=transaction_2, name="First Item"
         ).exists()
+        # The stored items were replaced, not duplicated
+        assert ATHM_Item.objects.filter(transaction=transaction_2).count() == 2
 
     def test_command_output_start_date_before_end_date(self):
         out = StringIO()
@@ -277,3 +277,103 @@ class TestSyncCommand:
             "Missing private token! Did you forget to set it in your settings?"
             == str(error.value)
         )
+
+    @pytest.mark.django_db
+    def test_command_skips_unchanged_items(self, mock_http_adapter_get_with_data):
+        mock_http_adapter_get_with_data.return_value = [
+            {
+                "transactionType": "ECOMMERCE",
+                "status": "COMPLETED",
+                "referenceNumber": "212831546-402894d56b240610016b2e6c78a6003a",
+                "date": "2019-06-06 16:12:02.0",
+                "name": "Tester Test",
+                "phoneNumber": "(787) 123-4567",
+                "email": "tester@django-athm.com",
+                "total": "1.00",
+                "totalRefundAmount": "0.00",
+                "tax": "0.00",
+                "subtotal": "1.00",
+                "metadata1": "metadata1 test",
+                "metadata2": "metadata2 test",
+                "items": [
+                    {
+                        "name": "First Item",
+                        "description": "This is a description.",
+                        "quantity": "1",
+                        "price": "1.00",
+                        "tax": "0.00",
+                        "metadata": "metadata test",
+                    },
+                ],
+            },
+        ]
+
+        for _ in range(2):
+            call_command(
+                "athm_sync",
+                start=parse_datetime("2020-01-01 12:00:00"),
+                end=parse_datetime("2020-01-02 00:00:00"),
+                stdout=StringIO(),
+            )
+
+        assert ATHM_Transaction.objects.count() == 1
+        assert ATHM_Item.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_command_replaces_changed_items(self, mock_http_adapter_get_with_data):
+        transaction_data = {
+            "transactionType": "ECOMMERCE",
+            "status": "COMPLETED",
+            "referenceNumber": "212831546-402894d56b240610016b2e6c78a6003a",
+            "date": "2019-06-06 16:12:02.0",
+            "name": "Tester Test",
+            "phoneNumber": "(787) 123-4567",
+            "email": "tester@django-athm.com",
+            "total": "1.00",
+            "totalRefundAmount": "0.00",
+            "tax": "0.00",
+            "subtotal": "1.00",
+            "metadata1": "metadata1 test",
+            "metadata2": "metadata2 test",
+            "items": [
+                {
+                    "name": "First Item",
+                    "description": "This is a description.",
+                    "quantity": "1",
+                    "price": "1.00",
+                    "tax": "0.00",
+                    "metadata": "metadata test",
+                },
+            ],
+        }
+        mock_http_adapter_get_with_data.return_value = [transaction_data]
+
+        call_command(
+            "athm_sync",
+            start=parse_datetime("2020-01-01 12:00:00"),
+            end=parse_datetime("2020-01-02 00:00:00"),
+            stdout=StringIO(),
+        )
+
+        transaction_data["items"] = [
+            {
+                "name": "Replacement Item",
+                "description": "This is another description.",
+                "quantity": "2",
+                "price": "0.50",
+                "tax": "0.00",
+                "metadata": "metadata test",
+            },
+        ]
+
+        call_command(
+            "athm_sync",
+            start=parse_datetime("2020-01-01 12:00:00"),
+            end=parse_datetime("2020-01-02 00:00:00"),
+            stdout=StringIO(),
+        )
+
+        assert ATHM_Transaction.objects.count() == 1
+        assert list(ATHM_Item.objects.values_list("name", flat=True)) == [
+            "Replacement Item"
+        ]
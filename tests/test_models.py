@@ -96,16 +96,11 @@ class TestATHM_Transaction:
         )
 
     def test_str_representation(self):
-        transaction = models.ATHM_Transaction.objects.create(
+        # __str__ only reads a field, so an unsaved instance is enough
+        transaction = models.ATHM_Transaction(
             reference_number="test-reference-number",
             status=models.ATHM_Transaction.Status.PROCESSING,
-            date=make_aware(parse_datetime("2022-08-05 10:00:00.0")),
             total=25.50,
-            tax=1.75,
-            refunded_amount=None,
-            subtotal=23.75,
-            metadata_1="Testing Metadata 1",
-            metadata_2=None,
         )
 
         assert str(transaction) == "test-reference-number"
@@ -1,3 +1,6 @@
+import logging
+
+import django
 from django.dispatch import receiver
 from django.template import Context, Template
 
@@ -31,3 +34,72 @@ class TestTemplateSignals:
             "{% load athm_response_signal %} {% athm_response_signal 'completed' %}"
         )
         template_to_render.render(context=Context())
+
+    def test_failing_receiver_does_not_break_rendering(self, caplog):
+        def failing_receiver(sender, **kwargs):
+            raise RuntimeError("Receiver failed")
+
+        signals.athm_response_received.connect(failing_receiver)
+
+        try:
+            template_to_render = Template(
+                "{% load athm_response_signal %} {% athm_response_signal 'completed' %}"
+            )
+            with caplog.at_level(logging.ERROR):
+                template_to_render.render(context=Context())
+        finally:
+            signals.athm_response_received.disconnect(failing_receiver)
+
+        # Logged exactly once, by Django itself or by the tag on older versions
+        records = [
+            record
+            for record in caplog.records
+            if record.exc_info and str(record.exc_info[1]) == "Receiver failed"
+        ]
+        assert len(records) == 1
+        assert records[0].levelno == logging.ERROR
+
+    def test_failing_receiver_logged_before_django_4_1(self, caplog, monkeypatch):
+        def failing_receiver(sender, **kwargs):
+            raise RuntimeError("Receiver failed")
+
+        monkeypatch.setattr(django, "VERSION", (4, 0, 0, "final", 0))
+        signals.athm_response_received.connect(failing_receiver)
+
+        try:
+            template_to_render = Template(
+                "{% load athm_response_signal %} {% athm_response_signal 'completed' %}"
+            )
+            with caplog.at_level(logging.ERROR):
+                template_to_render.render(context=Context())
+        finally:
+            signals.athm_response_received.disconnect(failing_receiver)
+
+        records = [
+            record
+            for record in caplog.records
+            if record.name == "django_athm.templatetags.athm_response_signal"
+        ]
+        assert len(records) == 1
+        assert records[0].receiver is failing_receiver
+        assert str(records[0].exc_info[1]) == "Receiver failed"
+
+    def test_status_signals_require_exact_status(self):
+        received = []
+
+        def status_receiver(sender, **kwargs):
+            received.append(sender)
+
+        signals.athm_completed_response.connect(status_receiver)
+
+        try:
+            template_to_render = Template(
+                "{% load athm_response_signal %} {% athm_response_signal 'completed' %}"
+            )
+            template_to_render.render(context=Context())
+        finally:
+            signals.athm_completed_response.disconnect(status_receiver)
+
+        # athm_button.html renders the tag with lowercase statuses on every page
+        # view, so only an exact TransactionStatus value may fire its signal
+        assert received == []
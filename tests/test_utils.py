@@ -21,3 +21,35 @@ class TestSyncHTTPAdapter:
 
         assert response["mocked"]
         assert mock_httpx.routes["post_refund"].called
+
+    def test_adapter_reuses_client(self, mock_httpx):
+        adapter = utils.SyncHTTPAdapter()
+
+        adapter.post(constants.REFUND_URL, data={})
+        client = adapter.client
+        adapter.post(constants.SEARCH_URL, data={})
+
+        assert adapter.client is client
+        assert mock_httpx.routes["post_status"].called
+
+
+def test_format_phone_number():
+    assert utils.format_phone_number("(787) 123-4567") == "+17871234567"
+    assert utils.format_phone_number("787.123.4567") == "+17871234567"
+    assert utils.format_phone_number("(787) 123-4567 x12") == "+17871234567"
+    assert utils.format_phone_number("787-123-4567 ext. 12") == "+17871234567"
+
+
+def test_format_phone_number_malformed():
+    assert utils.format_phone_number("not-a-phone") is None
+    assert utils.format_phone_number("") is None
+    assert utils.format_phone_number(None) is None
+
+
+def test_get_items_hash():
+    items = [{"name": "First Item", "price": "1.00"}]
+
+    assert utils.get_items_hash(items) == utils.get_items_hash(
+        [{"price": "1.00", "name": "First Item"}]
+    )
+    assert utils.get_items_hash(items) != utils.get_items_hash([])
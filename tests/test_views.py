@@ -1,8 +1,12 @@
+import json
+
 import pytest
+from django.db import IntegrityError
 from django.urls import reverse
+from django.utils import timezone
 
 from django_athm.constants import TransactionStatus, TransactionType
-from django_athm.models import ATHM_Item, ATHM_Transaction
+from django_athm.models import ATHM_Client, ATHM_Item, ATHM_Transaction
 from django_athm.views import default_callback
 
 
@@ -74,3 +78,250 @@ class TestDefaultCallbackView:
         item = ATHM_Item.objects.first()
         assert item.name == "First Item"
         assert item.price == 1.0
+
+    @pytest.mark.django_db
+    def test_callback_view_without_items(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "refundedAmount": "1.00",
+            "total": "1.0",
+            "tax": "",
+            "subtotal": "",
+            "metadata1": "",
+            "metadata2": "",
+            "items": "[]",
+        }
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+        response = default_callback(request)
+
+        assert response.status_code == 201
+
+        assert ATHM_Transaction.objects.count() == 1
+        assert ATHM_Item.objects.count() == 0
+
+    @pytest.mark.django_db
+    def test_callback_view_missing_field(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "refundedAmount": "1.00",
+            "total": "1.0",
+            "tax": "",
+            "subtotal": "",
+            "metadata2": "",
+            "items": "[]",
+        }
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+        response = default_callback(request)
+
+        assert response.status_code == 400
+        assert json.loads(response.content) == {
+            "error": "Missing required field: metadata1"
+        }
+        assert ATHM_Transaction.objects.count() == 0
+
+    @pytest.mark.django_db
+    def test_callback_view_invalid_value(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "refundedAmount": "1.00",
+            "total": "not-a-number",
+            "tax": "",
+            "subtotal": "",
+            "metadata1": "",
+            "metadata2": "",
+            "items": "[]",
+        }
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+        response = default_callback(request)
+
+        assert response.status_code == 400
+        assert json.loads(response.content) == {"error": "Invalid field value format"}
+        assert ATHM_Transaction.objects.count() == 0
+
+    @pytest.mark.django_db
+    def test_callback_view_with_client(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "name": "Tester Test",
+            "phoneNumber": "(787) 123-4567",
+            "email": "tester@django-athm.com",
+            "total": "1.0",
+            "tax": "",
+            "subtotal": "",
+            "metadata1": "",
+            "metadata2": "",
+            "items": "[]",
+        }
+
+        ATHM_Client.objects.create(
+            name="Old Name", email="tester@django-athm.com", phone_number="+17871234567"
+        )
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+        response = default_callback(request)
+
+        assert response.status_code == 201
+
+        assert ATHM_Client.objects.count() == 1
+        client = ATHM_Client.objects.get()
+        assert client.name == "Tester Test"
+        assert client.email == "tester@django-athm.com"
+
+        transaction = ATHM_Transaction.objects.get()
+        assert transaction.client == client
+
+    @pytest.mark.django_db
+    def test_callback_view_with_shared_phone_number(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "name": "Bob",
+            "phoneNumber": "(787) 123-4567",
+            "email": "bob@django-athm.com",
+            "total": "1.0",
+            "tax": "",
+            "subtotal": "",
+            "metadata1": "",
+            "metadata2": "",
+            "items": "[]",
+        }
+
+        alice = ATHM_Client.objects.create(
+            name="Alice", email="alice@django-athm.com", phone_number="+17871234567"
+        )
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+        response = default_callback(request)
+
+        assert response.status_code == 201
+        assert ATHM_Client.objects.count() == 2
+
+        # Another client's stored details are never rewritten
+        alice.refresh_from_db()
+        assert alice.name == "Alice"
+        assert alice.email == "alice@django-athm.com"
+
+        transaction = ATHM_Transaction.objects.get()
+        assert transaction.client != alice
+        assert transaction.client.name == "Bob"
+        assert transaction.client.email == "bob@django-athm.com"
+        assert transaction.client.phone_number == "+17871234567"
+
+    @pytest.mark.django_db
+    def test_callback_view_failed_insert_keeps_client(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "name": "Tester Test",
+            "phoneNumber": "(787) 123-4567",
+            "email": "tester@django-athm.com",
+            "total": "1.0",
+            "tax": "",
+            "subtotal": "",
+            "metadata1": "",
+            "metadata2": "",
+            "items": "[]",
+        }
+
+        client = ATHM_Client.objects.create(
+            name="Old Name", phone_number="+17871234567"
+        )
+        ATHM_Transaction.objects.create(
+            reference_number="33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            status=ATHM_Transaction.Status.COMPLETED,
+            date=timezone.now(),
+            total=1.0,
+        )
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+
+        # A duplicate reference number must not leave the client half-updated
+        with pytest.raises(IntegrityError):
+            default_callback(request)
+
+        assert ATHM_Client.objects.count() == 1
+        client.refresh_from_db()
+        assert client.name == "Old Name"
+        assert client.email == ""
+
+    @pytest.mark.django_db
+    def test_callback_view_updates_client_with_same_email(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "name": "Tester Test",
+            "phoneNumber": "(787) 123-4567",
+            "email": "second@django-athm.com",
+            "total": "1.0",
+            "tax": "",
+            "subtotal": "",
+            "metadata1": "",
+            "metadata2": "",
+            "items": "[]",
+        }
+
+        first_client = ATHM_Client.objects.create(
+            name="First", email="first@django-athm.com", phone_number="+17871234567"
+        )
+        second_client = ATHM_Client.objects.create(
+            name="Second", email="second@django-athm.com", phone_number="+17871234567"
+        )
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+        response = default_callback(request)
+
+        assert response.status_code == 201
+
+        first_client.refresh_from_db()
+        second_client.refresh_from_db()
+        assert first_client.name == "First"
+        assert second_client.name == "Tester Test"
+
+        transaction = ATHM_Transaction.objects.get()
+        assert transaction.client == second_client
+
+    @pytest.mark.django_db
+    def test_callback_view_missing_item_field(self, rf):
+        data = {
+            "status": TransactionStatus.completed.value,
+            "referenceNumber": "33908215-4028f9e06fd3c5c1016fdef4714a369a",
+            "date": "2020-01-25 19:05:53.0",
+            "refundedAmount": "1.00",
+            "total": "1.0",
+            "tax": "",
+            "subtotal": "",
+            "metadata1": "",
+            "metadata2": "",
+            "items": '[{"description": "Item without a name", "quantity": "1", "price": "1.0", "tax": "", "metadata": ""}]',
+        }
+
+        url = reverse("django_athm:athm_callback")
+        request = rf.post(url, data=data)
+        response = default_callback(request)
+
+        assert response.status_code == 400
+        assert json.loads(response.content) == {
+            "error": "Missing required item field: name"
+        }
+        assert ATHM_Transaction.objects.count() == 0